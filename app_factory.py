@@ -0,0 +1,22 @@
+"""
+Shared FastAPI app setup for the Perfume Store AI Bot entry points
+"""
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+def create_app(**kwargs) -> FastAPI:
+    """Create a FastAPI app with orjson responses and CORS enabled"""
+    app = FastAPI(default_response_class=ORJSONResponse, **kwargs)
+    
+    # Enable CORS for Android app
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    return app
@@ -0,0 +1,20 @@
+"""
+Shared request/response models for the Perfume Store AI Bot
+"""
+
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List
+
+class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    message: str
+    user_id: Optional[str] = None
+
+class ChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    response: str
+    suggestions: List[str] = []
+    confidence: float
+    timestamp: str
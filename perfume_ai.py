@@ -0,0 +1,347 @@
+"""
+Perfume AI core - training data loading, indexing and response generation
+"""
+
+from typing import Optional, List, Dict, Mapping, Sequence
+import orjson
+import random
+import itertools
+import mmap
+import re
+import ahocorasick
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+
+# ========== LOAD TRAINING DATA ==========
+def load_training_data(path: str = "training_data.json"):
+    """Load perfumes from the training data file"""
+    try:
+        # Parse straight from the mapped file instead of copying it into a buffer first
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as buf:
+            data = orjson.loads(buf)
+            perfumes = data.get("perfumes", [])
+            faqs = data.get("faqs", [])
+            intents = data.get("intents", [])
+            
+            # Add IDs to perfumes if not present
+            for i, perfume in enumerate(perfumes):
+                if 'id' not in perfume:
+                    perfume['id'] = i + 1
+            
+            print(f"✅ Loaded: {len(perfumes)} perfumes, {len(faqs)} FAQs, {len(intents)} intents")
+            return perfumes, faqs, intents
+            
+    except FileNotFoundError:
+        print(f"⚠️ {path} not found. Using default perfumes.")
+        # Return default perfumes if file doesn't exist
+        return [
+            {"id": 1, "name": "Floral Dream", "price": 45.99, "category": "floral"},
+            {"id": 2, "name": "Woody Essence", "price": 59.99, "category": "woody"},
+            {"id": 3, "name": "Citrus Splash", "price": 39.99, "category": "citrus"},
+        ], [], []
+    except ValueError:
+        # orjson.JSONDecodeError, or mmap refusing an empty file
+        print(f"❌ Error: {path} has invalid JSON format")
+        return [], [], []
+
+def build_indexes(perfumes: List[Dict]):
+    """Index perfumes by id and by category for constant-time lookups"""
+    id_index = {}
+    category_index = defaultdict(list)
+    for perfume in perfumes:
+        # First perfume wins on duplicate ids, like the old linear scan
+        id_index.setdefault(perfume['id'], perfume)
+        if perfume.get('category'):
+            category_index[perfume['category']].append(perfume)
+    
+    return id_index, dict(category_index)
+
+# ========== AI LOGIC ==========
+GREETING_RESPONSES = [
+    "👋 Hello! Welcome to our perfume store! How can I help you today?",
+    "🌟 Welcome to our fragrance boutique! What scent are you looking for?",
+    "🌸 Hello there! Ready to find your perfect fragrance?"
+]
+
+FALLBACK_RESPONSES = [
+    "I'm not sure I understood. Try asking about specific perfumes or categories.",
+    "Could you be more specific? For example, ask about 'Floral Dream' or 'woody perfumes'.",
+    "I'm here to help you find perfumes! Try asking for recommendations or checking prices."
+]
+
+# Keywords used when no training intent matches, in priority order
+FALLBACK_INTENTS = {
+    "greeting": ["hi", "hello", "hey"],
+    "recommendation": ["recommend", "suggest"],
+    "price_inquiry": ["price", "how much", "cost"],
+    "category_query": ["floral", "woody", "citrus", "fresh", "oriental"],
+}
+
+# One alternation with a named group per intent, so a single scan finds them all.
+# The lookahead keeps matches zero-width, so every start position is tried and one
+# keyword can't swallow the start of another (e.g. "fresh" hiding "hi" in "refreshing").
+_FALLBACK_INTENT_RE = re.compile("(?=" + "|".join(
+    f"(?P<{intent}>{'|'.join(re.escape(word) for word in words)})"
+    for intent, words in FALLBACK_INTENTS.items()
+) + ")")
+
+# Longer messages skip the response cache; repeats worth caching are short
+MAX_CACHED_MESSAGE_LENGTH = 256
+
+class PerfumeAI:
+    __slots__ = (
+        "perfumes", "faqs", "intents", "id_index", "category_index", "automaton",
+        "perfume_cards", "price_response", "category_responses",
+        "recommended", "recommendation_response", "rotating_responses", "_respond_cached",
+    )
+    
+    def __init__(self, perfumes: List[Dict], faqs: List[Dict], intents: List[Dict]):
+        self.perfumes = perfumes
+        self.faqs = faqs
+        self.intents = intents
+        self.id_index, self.category_index = build_indexes(perfumes)
+        self.automaton = self.build_automaton()
+        
+        # Perfume data is immutable at runtime, so format the replies up front
+        self.perfume_cards = [self.build_card(perfume) for perfume in self.perfumes]
+        self.price_response = self.build_price_list(self.perfumes[:5])  # Show first 5
+        self.category_responses = {
+            category: self.build_category_listing(category, perfumes)
+            for category, perfumes in self.category_index.items()
+        }
+        
+        # Pick the top 3 recommendations once instead of sampling per request
+        self.recommended = tuple(random.sample(self.perfumes, min(3, len(self.perfumes))))
+        self.recommendation_response = self.build_recommendation(self.recommended)
+        
+        # Shuffle once and rotate, instead of drawing a random reply per request
+        self.rotating_responses = {
+            "greeting": itertools.cycle(random.sample(GREETING_RESPONSES, len(GREETING_RESPONSES))),
+            "fallback": itertools.cycle(random.sample(FALLBACK_RESPONSES, len(FALLBACK_RESPONSES))),
+        }
+        
+        # Per-instance cache: no shared budget, and no class-level cache keeping instances alive
+        self._respond_cached = lru_cache(maxsize=2048)(self._respond)
+        
+    def build_automaton(self) -> ahocorasick.Automaton:
+        """Index every intent pattern, perfume keyword and FAQ keyword in one automaton"""
+        keywords = {}
+        
+        def add(keyword: str, kind: str, index: int):
+            keyword = keyword.lower()
+            if keyword:
+                keywords.setdefault(keyword, []).append((kind, index))
+        
+        for i, intent in enumerate(self.intents):
+            for pattern in intent.get('patterns', []):
+                add(pattern, "intent", i)
+        
+        for i, perfume in enumerate(self.perfumes):
+            add(perfume.get('name', ''), "perfume_name", i)
+            add(perfume.get('category', ''), "perfume_category", i)
+            for note in perfume.get('notes', []):
+                add(note, "perfume_note", i)
+        
+        for i, faq in enumerate(self.faqs):
+            # Simple keyword matching on the first words of the question
+            for word in faq.get('question', '').lower().split()[:3]:
+                add(word, "faq", i)
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, payloads in keywords.items():
+            automaton.add_word(keyword, tuple(payloads))
+        automaton.make_automaton()
+        return automaton
+    
+    def build_card(self, perfume: Dict) -> str:
+        """Format the info card for a single perfume"""
+        response = f"**{perfume['name']}**\n\n"
+        response += f"💰 Price: ${perfume['price']}\n"
+        
+        if 'category' in perfume:
+            response += f"🌸 Category: {perfume['category'].title()}\n"
+        
+        if 'notes' in perfume and perfume['notes']:
+            response += f"🎀 Notes: {', '.join(perfume['notes'][:3])}\n"
+        
+        if 'description' in perfume:
+            response += f"\n{perfume['description']}"
+        
+        return response
+    
+    def build_price_list(self, perfumes: List[Dict]) -> str:
+        """Format the price overview"""
+        response = "💰 **Our Perfume Prices:**\n\n"
+        for perfume in perfumes:
+            response += f"• {perfume['name']}: ${perfume['price']}\n"
+        return response
+    
+    def build_recommendation(self, recommended: Sequence[Dict]) -> str:
+        """Format the recommendation message"""
+        response = "✨ **Top Recommendations:**\n\n"
+        for perfume in recommended:
+            response += f"⭐ **{perfume['name']}** - ${perfume['price']}\n"
+            if 'description' in perfume:
+                response += f"   {perfume['description']}\n\n"
+        return response
+    
+    def build_category_listing(self, category: str, perfumes: List[Dict]) -> str:
+        """Format the list of perfumes in a category"""
+        response = f"🌸 **{category.title()} Perfumes:**\n\n"
+        for perfume in perfumes:
+            response += f"• **{perfume['name']}** - ${perfume['price']}\n"
+        return response
+    
+    def match(self, message: str) -> Dict[str, int]:
+        """Scan the message once, keeping the earliest entry matched for each kind"""
+        matches = {}
+        if not len(self.automaton):
+            return matches
+        
+        for _, payloads in self.automaton.iter(message.lower()):
+            for kind, index in payloads:
+                if kind not in matches or index < matches[kind]:
+                    matches[kind] = index
+        
+        return matches
+        
+    def match_fallback(self, message: str) -> Dict[str, str]:
+        """Scan for fallback keywords once, keeping the first-listed keyword per intent"""
+        found = {}
+        for m in _FALLBACK_INTENT_RE.finditer(message.lower()):
+            intent = m.lastgroup
+            keyword = m.group(intent)
+            keywords = FALLBACK_INTENTS[intent]
+            if intent not in found or keywords.index(keyword) < keywords.index(found[intent]):
+                found[intent] = keyword
+        return found
+    
+    def find_intent(self, message: str, matches: Optional[Dict[str, int]] = None,
+                    fallback: Optional[Dict[str, str]] = None) -> str:
+        """Detect user intent"""
+        if matches is None:
+            matches = self.match(message)
+        
+        # Check intents from training data
+        if "intent" in matches:
+            return self.intents[matches["intent"]].get('name', 'unknown')
+        
+        # Fallback intent detection, earlier intents win
+        if fallback is None:
+            fallback = self.match_fallback(message)
+        return next((intent for intent in FALLBACK_INTENTS if intent in fallback), "unknown")
+    
+    def answer_faq(self, question: str, matches: Optional[Dict[str, int]] = None) -> Optional[str]:
+        """Answer FAQ questions"""
+        if matches is None:
+            matches = self.match(question)
+        
+        if "faq" in matches:
+            return self.faqs[matches["faq"]].get('answer')
+        
+        return None
+    
+    def find_perfume(self, query: str, matches: Optional[Dict[str, int]] = None) -> Optional[Dict]:
+        """Find perfume by name, category, or notes"""
+        if matches is None:
+            matches = self.match(query)
+        
+        index = self._perfume_index(matches)
+        return self.perfumes[index] if index is not None else None
+    
+    def _perfume_index(self, matches: Dict[str, int]) -> Optional[int]:
+        """Position of the matched perfume; name beats category, category beats notes"""
+        for kind in ("perfume_name", "perfume_category", "perfume_note"):
+            if kind in matches:
+                return matches[kind]
+        
+        return None
+    
+    def generate_response(self, message: str) -> Mapping:
+        """Generate AI response (read-only top-level mapping)"""
+        msg_lower = message.lower().strip()
+        
+        # Only short messages are cached, so long inputs can't pin memory in every worker
+        if len(msg_lower) <= MAX_CACHED_MESSAGE_LENGTH:
+            result = self._respond_cached(msg_lower)
+        else:
+            result = self._respond(msg_lower)
+        
+        # Rotating replies are filled in outside the cache so repeats still vary
+        if result["type"] in self.rotating_responses:
+            return MappingProxyType({**result, "response": next(self.rotating_responses[result["type"]])})
+        
+        # Cached results are shared between requests, so hand out a read-only view.
+        # Only the top level is protected: "perfume"/"perfumes" are the shared catalog
+        # entries, as before the cache, and must not be modified by callers.
+        return MappingProxyType(result)
+    
+    def _respond(self, msg_lower: str) -> Dict:
+        """Build the cacheable part of a response; greeting/fallback leave out the reply text"""
+        matches = self.match(msg_lower)
+        
+        # Step 1: Try to answer FAQ
+        faq_answer = self.answer_faq(msg_lower, matches)
+        if faq_answer:
+            return {
+                "response": faq_answer,
+                "type": "faq",
+                "confidence": 0.9
+            }
+        
+        # Step 2: Try to find perfume
+        index = self._perfume_index(matches)
+        if index is not None:
+            return {
+                "response": self.perfume_cards[index],
+                "type": "perfume_info",
+                "confidence": 0.8,
+                "perfume": self.perfumes[index]
+            }
+        
+        # Step 3: Handle intents
+        fallback = self.match_fallback(msg_lower)
+        intent = self.find_intent(msg_lower, matches, fallback)
+        
+        if intent == "greeting":
+            return {
+                "type": "greeting",
+                "confidence": 0.9
+            }
+        
+        elif intent == "recommendation":
+            if self.recommended:
+                return {
+                    "response": self.recommendation_response,
+                    "type": "recommendation",
+                    "confidence": 0.8,
+                    "perfumes": self.recommended
+                }
+        
+        elif intent == "price_inquiry":
+            if self.perfumes:
+                return {
+                    "response": self.price_response,
+                    "type": "price_info",
+                    "confidence": 0.7
+                }
+        
+        elif intent == "category_query":
+            # The keyword scan already found which category was mentioned
+            mentioned_category = fallback.get("category_query")
+            
+            if mentioned_category in self.category_responses:
+                return {
+                    "response": self.category_responses[mentioned_category],
+                    "type": "category_info",
+                    "confidence": 0.8
+                }
+        
+        # Step 4: Fallback response
+        return {
+            "type": "fallback",
+            "confidence": 0.3
+        }